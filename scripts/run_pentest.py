@@ -176,9 +176,11 @@ def main() -> int:
         # Step 3: Combine onboarded models with selected models
         if onboarded_resource_ids:
             print(f"[i] Adding {len(onboarded_resource_ids)} onboarded model(s) to scan queue")
-            # Add onboarded models to the scan list
+            # Add onboarded models to the scan list (set of ids for O(1) membership/dedupe)
+            seen_ids = set(ms_ids)
             for res_id in onboarded_resource_ids:
-                if res_id not in ms_ids:
+                if res_id not in seen_ids:
+                    seen_ids.add(res_id)
                     ms_ids.append(res_id)
                     # Try to get the display name from the onboarding response
                     # For now, use a placeholder - the actual name will be fetched during scanning
@@ -5,12 +5,39 @@ from datetime import datetime, timezone
 import time as _t
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import src.alltrue_scanner.config as config
 from src.alltrue_scanner.utils import parse_csv_string
 
 
 # ---------- Masking / HTTP core ----------
 
+# Shared session: reuse pooled keep-alive connections instead of a new TLS handshake per call.
+# Accept-Encoding is requests' default too; set explicitly since polled GraphQL JSON compresses well.
+# urllib3 only retries idempotent methods; POSTs keep their own retry/504 handling in callers.
+# read=False: read timeouts are not retried and surface as requests.ReadTimeout, as before.
+# raise_on_status=False returns the last response so raise_for_status() still raises HTTPError.
+# respect_retry_after_header=False: a large Retry-After would otherwise sleep silently past the caller's timeout.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        ),
+    ),
+)
+
+
 def _mask(s: str, show: int = 4) -> str:
     if not s:
         return s
@@ -38,7 +65,7 @@ def make_api_request(
         headers["X-API-Key"] = config.API_KEY
 
     url = f"{config.API_URL}{endpoint}"
-    resp = requests.request(method, url, headers=headers, params=params, json=data, timeout=timeout)
+    resp = _SESSION.request(method, url, headers=headers, params=params, json=data, timeout=timeout)
     try:
         resp.raise_for_status()
     except requests.HTTPError:
@@ -929,8 +956,32 @@ def query_model_scan_execution_full(jwt_token: str, model_scan_execution_id: str
     return data or {}
 
 
+def query_model_scan_execution_status(jwt_token: str, model_scan_execution_id: str) -> dict:
+    """
+    Lightweight status-only fetch used while polling for completion.
+    Fetch the full results with query_model_scan_execution_full once COMPLETED.
+    """
+    graphql_query = """
+    query ModelScanExecutionStatus($customerId: UUID!, $modelScanExecutionId: UUID!) {
+      modelScanExecution(filter: {customerId: $customerId, modelScanExecutionId: $modelScanExecutionId}) {
+        status
+      }
+    }
+    """.strip()
+    data = run_graphql(
+        jwt_token,
+        graphql_query,
+        {"customerId": config.CUSTOMER_ID, "modelScanExecutionId": model_scan_execution_id},
+        version="v2",
+        timeout=30,
+    )
+    return (data or {}).get("modelScanExecution") or {}
+
+
 # ---------- v2 GraphQL: PentestScanSummaries ----------
 
+# Polled repeatedly while binding an execution id; only select what
+# _try_fetch_model_scan_id_once reads.
 _MODEL_SCAN_SUMMARIES_QUERY = """
 query ModelScanSummaries($customerId: UUID!, $organizationId: UUID, $projectId: UUID) {
   modelScanSummaries(
@@ -943,27 +994,14 @@ query ModelScanSummaries($customerId: UUID!, $organizationId: UUID, $projectId:
     }
   ) {
     pagination {
-      currentPage
-      perPage
       totalItems
     }
     items {
       startedAt
-      executionStatus
       modelScanExecutionId
       modelScanExecutionStatus
-      modelScanIsCompleted
-      modelScanPolicies
-      modelScanScope
-      numOfIssues
-      outcomeLevel
       resourceInstance {
-        customerId
-        displayName
-        registeredAt
-        resourceIdentifier
         resourceInstanceId
-        resourceType
       }
     }
   }
@@ -1028,9 +1066,19 @@ def _poll_until(
     fetch_func: Callable[[], Optional[T]],
     timeout_secs: float,
     interval_secs: float,
+    *,
+    max_interval_secs: Optional[float] = None,
+    backoff: float = 1.0,
 ) -> Optional[T]:
-    """Generic polling helper: repeatedly calls fetch_func until it returns a truthy value or times out."""
+    """
+    Generic polling helper: repeatedly calls fetch_func until it returns a truthy value or times out.
+
+    With backoff > 1.0 the sleep starts at interval_secs and grows by that factor
+    after each miss, capped at max_interval_secs (defaults to interval_secs, i.e. fixed).
+    """
     deadline = _t.monotonic() + max(0.0, timeout_secs)
+    interval = max(0.0, interval_secs)
+    cap = max(interval, max_interval_secs if max_interval_secs is not None else interval)
     while _t.monotonic() < deadline:
         try:
             result = fetch_func()
@@ -1039,10 +1087,51 @@ def _poll_until(
         except Exception:
             # Swallow and keep polling; callers should handle logging/retries if desired.
             pass
-        _t.sleep(max(0.0, interval_secs))
+        _t.sleep(min(interval, max(0.0, deadline - _t.monotonic())))
+        interval = min(cap, interval * backoff)
     return None
 
 
+# Every model-scan worker thread polls the same org-wide summaries page while
+# binding its execution id. Concurrent callers share one in-flight request, and a
+# result that finished within the last second is reused; anything older is
+# refetched, so a worker never gets back its own previous poll (polls are >= 2s apart).
+_SUMMARIES_SHARED_TTL_SECS = 1.0
+_summaries_cache: Dict[tuple, tuple] = {}
+_summaries_scope_locks: Dict[tuple, threading.Lock] = {}
+_summaries_lock = threading.Lock()
+
+
+def _fetch_model_scan_summaries_shared(jwt_token: str, variables: Dict[str, Any]) -> dict:
+    """
+    Run _MODEL_SCAN_SUMMARIES_QUERY once for all threads polling the same org/project scope.
+
+    Reuses a result that finished after this call started (a concurrent fetch) or
+    within _SUMMARIES_SHARED_TTL_SECS before it. A per-scope lock is held across the
+    request, so if it stalls, other workers polling the same scope wait with it
+    (up to the 60s request timeout) instead of issuing their own.
+    """
+    key = (variables.get("organizationId"), variables.get("projectId"))
+    asked_at = _t.monotonic()
+    with _summaries_lock:
+        scope_lock = _summaries_scope_locks.setdefault(key, threading.Lock())
+
+    with scope_lock:
+        cached = _summaries_cache.get(key)
+        if cached is not None and cached[0] >= asked_at - _SUMMARIES_SHARED_TTL_SECS:
+            return cached[1]
+
+        data = run_graphql(
+            jwt_token,
+            _MODEL_SCAN_SUMMARIES_QUERY,
+            variables,
+            version="v2",
+            timeout=60,
+        )
+        _summaries_cache[key] = (_t.monotonic(), data)
+        return data
+
+
 def _try_fetch_model_scan_id_once(
     jwt_token: str,
     *,
@@ -1067,13 +1156,7 @@ def _try_fetch_model_scan_id_once(
         "projectId": project_id,
     }
 
-    data = run_graphql(
-        jwt_token,
-        _MODEL_SCAN_SUMMARIES_QUERY,
-        variables,
-        version="v2",
-        timeout=60,
-    )
+    data = _fetch_model_scan_summaries_shared(jwt_token, variables)
 
     # Extract items from the response
     summaries = data.get("modelScanSummaries") or {}
@@ -1130,7 +1213,7 @@ def poll_model_scan_execution_id(
     Args:
         jwt_token: JWT authentication token
         resource_instance_id: The resource UUID to find execution for
-        poll_interval_secs: Seconds between poll attempts
+        poll_interval_secs: Max seconds between poll attempts (polling starts at 2s and backs off to this)
         timeout_secs: Maximum time to poll before giving up
         min_started_at_iso: Optional ISO timestamp - only return executions started after this time
 
@@ -1156,7 +1239,15 @@ def poll_model_scan_execution_id(
             return msid or None
         return None
 
-    result = _poll_until(_fetch, timeout_secs=timeout_secs, interval_secs=poll_interval_secs)
+    # The execution usually shows up within seconds of check-policies, so start
+    # fast and back off towards poll_interval_secs instead of waiting a full interval.
+    result = _poll_until(
+        _fetch,
+        timeout_secs=timeout_secs,
+        interval_secs=min(2.0, poll_interval_secs),
+        max_interval_secs=poll_interval_secs,
+        backoff=1.5,
+    )
 
     if not result:
         print(f"[model-scan-bind] Failed to resolve execution ID after {timeout_secs}s")
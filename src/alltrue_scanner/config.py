@@ -65,6 +65,13 @@ HUGGINGFACE_MODELS_TO_ONBOARD = os.getenv("HUGGINGFACE_MODELS_TO_ONBOARD", "")
 # Allows time for models to be indexed in inventory
 HUGGINGFACE_ONBOARDING_WAIT_SECS = float(os.getenv("HUGGINGFACE_ONBOARDING_WAIT_SECS", "10"))
 
+# Max models per onboarding request (0 = all models in a single request)
+# When set, batches are submitted in parallel (see HUGGINGFACE_ONBOARDING_CONCURRENCY)
+HUGGINGFACE_ONBOARDING_BATCH_SIZE = int(os.getenv("HUGGINGFACE_ONBOARDING_BATCH_SIZE", "0"))
+
+# Max onboarding batch requests in flight at once (only used when batching)
+HUGGINGFACE_ONBOARDING_CONCURRENCY = int(os.getenv("HUGGINGFACE_ONBOARDING_CONCURRENCY", "4"))
+
 # Project ID to associate onboarded models with
 # If not specified, uses the first project from PROJECT_IDS
 HUGGINGFACE_ONBOARDING_PROJECT_ID = os.getenv("HUGGINGFACE_ONBOARDING_PROJECT_ID", "")
@@ -255,6 +262,9 @@ def print_config_banner() -> None:
         if HUGGINGFACE_ONBOARDING_PROJECT_ID:
             print(f"HUGGINGFACE_ONBOARDING_PROJECT_ID: {HUGGINGFACE_ONBOARDING_PROJECT_ID}")
         print(f"HUGGINGFACE_ONBOARDING_WAIT_SECS: {HUGGINGFACE_ONBOARDING_WAIT_SECS}")
+        if HUGGINGFACE_ONBOARDING_BATCH_SIZE > 0:
+            print(f"HUGGINGFACE_ONBOARDING_BATCH_SIZE: {HUGGINGFACE_ONBOARDING_BATCH_SIZE}")
+            print(f"HUGGINGFACE_ONBOARDING_CONCURRENCY: {HUGGINGFACE_ONBOARDING_CONCURRENCY}")
         print(f"HUGGINGFACE_ONBOARDING_ONLY: {HUGGINGFACE_ONBOARDING_ONLY}")
     print(f"INVENTORY_SCOPE: {INVENTORY_SCOPE}")
     if ORGANIZATION_ID:
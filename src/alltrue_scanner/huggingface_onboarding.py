@@ -2,7 +2,10 @@
 # Adds HuggingFace models to inventory before scanning
 
 from __future__ import annotations
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+import json
+import re
 import time
 
 import requests
@@ -10,12 +13,23 @@ import requests
 import src.alltrue_scanner.api as api
 import src.alltrue_scanner.config as config
 
+# Inventory onboarding endpoint; identical for every batch
+_ONBOARD_ENDPOINT = "/v1/inventory/resources"
+_ONBOARD_PARAMS = {"resource_source_type": "MANUAL_UPLOAD"}
+
+# How long to keep checking inventory after a 504 before giving up on missing models
+_TIMEOUT_VERIFY_SECS = 30.0
+
+# Simple-format entry: "org/repo" or "org/repo@revision" (whitespace around parts tolerated)
+_HF_ENTRY_RE = re.compile(r"^([^/]+?)\s*/\s*([^@]+?)\s*(?:@\s*(.*?))?$")
+
 
 def _verify_onboarded_resources(
     jwt: str,
     requested_resources: List[dict],
-    project_id: str
-) -> List[str]:
+    project_id: str,
+    verbose: bool = True,
+) -> Dict[str, str]:
     """
     Check inventory for recently onboarded resources after a 504 timeout.
     
@@ -26,117 +40,147 @@ def _verify_onboarded_resources(
         jwt: JWT authentication token
         requested_resources: List of resource configs that were submitted
         project_id: Project ID where resources should exist
+        verbose: Print query/miss details (disabled for repeat polls; "OK Verified" lines always print)
         
     Returns:
-        List of resource_instance_ids for resources found in inventory
+        Dict of display_name -> resource_instance_id for resources found in inventory
     """
     try:
-        print(f"[HF-Onboard] Querying inventory for {len(requested_resources)} model(s)...")
+        if verbose:
+            print(f"[HF-Onboard] Querying inventory for {len(requested_resources)} model(s)...")
         
         # Get recent model resources in the project
         # Use model and model_assets categories to catch all HuggingFace models
+        # Filter by display name server-side so only candidate matches come back;
+        # the exact-match loop below still guards against looser server matching.
         recent_models = api.list_resources(
             jwt,
             categories=["model", "model_assets"],
             project_id=project_id,
+            resource_display_names=list({r["display_name"] for r in requested_resources}),
         )
         
-        print(f"[HF-Onboard] Found {len(recent_models)} total model(s) in project inventory")
+        if verbose:
+            print(f"[HF-Onboard] Found {len(recent_models)} candidate model(s) in project inventory")
         
-        resource_ids = []
+        # Index inventory once by display name (first occurrence wins) so each
+        # requested model is an O(1) lookup instead of a scan of the whole project.
+        # Inventory rows carry resource_display_name (see inventory._default_name_getter).
+        inventory_by_name: Dict[str, str] = {}
+        for model in recent_models:
+            rid = model.get("resource_instance_id")
+            if rid:
+                name = model.get("resource_display_name") or model.get("display_name") or ""
+                inventory_by_name.setdefault(name, rid)
+
+        verified: Dict[str, str] = {}
         resource_name_map = {r["display_name"]: r for r in requested_resources}
-        
+
         # Match by display_name (exact match)
-        for req_display_name, req_config in resource_name_map.items():
-            for model in recent_models:
-                model_display_name = model.get("display_name", "")
-                
-                # Exact match on display name
-                if model_display_name == req_display_name:
-                    rid = model.get("resource_instance_id")
-                    if rid:
-                        resource_ids.append(rid)
-                        print(f"[HF-Onboard] OK Verified: {req_display_name}")
-                        print(f"              Resource ID: {rid}")
-                        break
+        for req_display_name in resource_name_map:
+            rid = inventory_by_name.get(req_display_name)
+            if rid:
+                verified[req_display_name] = rid
+                print(f"[HF-Onboard] OK Verified: {req_display_name}")
+                print(f"              Resource ID: {rid}")
         
-        if not resource_ids:
+        if not verified and verbose:
             print(f"[HF-Onboard] [!]  No matching resources found in inventory")
         
-        return resource_ids
+        return verified
         
     except Exception as e:
         print(f"[HF-Onboard] [!]  Error verifying resources: {e}")
-        return []
+        return {}
 
 
-def onboard_huggingface_models(jwt: str, models: List[Dict[str, Any]], project_id: str) -> List[str]:
+def _validate_models(models: List[Any], log_tag: str = "[HF-Onboard]") -> List[Dict[str, Any]]:
     """
-    Onboard one or more HuggingFace models to inventory.
+    Filter and normalize model configs before onboarding.
 
-    Args:
-        jwt: JWT authentication token
-        models: List of model configs, each containing:
-            - organization_id: HuggingFace organization/user (e.g., "IHasFarms")
-            - repo_name: HuggingFace repository name (e.g., "MaliciousModel")
-            - revision: Git revision (default: "main")
-            - display_name: Optional custom display name
-        project_id: Project ID to associate models with
-
-    Returns:
-        List of resource instance IDs for the onboarded models
+    Drops entries without a truthy organization_id / repo_name (logging one
+    summary line under log_tag), trims fields, and fills in revision (default
+    "main") and display_name (default "org/repo"). Returns new dicts; the
+    input is not mutated.
     """
-    if not models:
-        print("[HF-Onboard] No models to onboard")
-        return []
-
-    print(f"\n{'='*80}")
-    print(f"ONBOARDING {len(models)} HUGGINGFACE MODEL(S) TO INVENTORY")
-    print(f"{'='*80}")
-
-    # Build the resources payload
-    resources = []
+    valid: List[Dict[str, Any]] = []
+    skipped = 0
     for model in models:
-        org_id = model.get("organization_id")
-        repo_name = model.get("repo_name")
-        revision = model.get("revision", "main")
-        display_name = model.get("display_name")
-
+        if not isinstance(model, dict):
+            skipped += 1
+            continue
+        org_id = str(model.get("organization_id") or "").strip()
+        repo_name = str(model.get("repo_name") or "").strip()
         if not org_id or not repo_name:
-            print(f"[HF-Onboard] [!]  Skipping model: missing organization_id or repo_name")
+            skipped += 1
             continue
+        valid.append({
+            **model,
+            "organization_id": org_id,
+            "repo_name": repo_name,
+            "revision": str(model.get("revision") or "").strip() or "main",
+            # Auto-generate display name if not provided
+            "display_name": str(model.get("display_name") or "").strip() or f"{org_id}/{repo_name}",
+        })
 
-        # Auto-generate display name if not provided
-        if not display_name:
-            display_name = f"{org_id}/{repo_name}"
+    if skipped:
+        print(f"{log_tag} [!]  Skipping {skipped} model(s): missing organization_id or repo_name")
+    return valid
 
-        print(f"[HF-Onboard] Preparing: {display_name} (revision: {revision})")
 
-        resources.append({
-            "display_name": display_name,
-            "cloud_provider_account_id": None,
-            "resource_type": "ModelPackage",
-            "resource_data": {
-                "storage_source": "HUGGINGFACE",
-                "credentials": {
-                    "revision": revision,
-                    "organization_id": org_id,
-                    "repo_name": repo_name,
-                    "storage_source": "HUGGINGFACE"
-                }
-            },
-            "technology_types": ["ModelPackage"],
-            "project_ids": [project_id],
-            "reviewed": "approved"
-        })
+def _recover_timed_out_resources(jwt: str, resources: List[dict], project_id: str) -> Dict[str, str]:
+    """
+    Verify resources from every batch that hit a 504 with one shared inventory poll.
 
-    if not resources:
-        print("[HF-Onboard] No valid models to onboard")
-        return []
+    Called once after all batches finish, so N timed-out batches share one
+    poll instead of N. Inventory is polled with backoff (2s -> 10s) and returns
+    as soon as every model is found, instead of a fixed 10s sleep + one check.
+    Matches are kept across polls, so later polls only look for missing models.
 
-    # Make the API request
-    endpoint = "/v1/inventory/resources"
-    params = {"resource_source_type": "MANUAL_UPLOAD"}
+    Returns:
+        Dict of display_name -> resource_instance_id for the models found
+    """
+    found: Dict[str, str] = {}
+    print(f"[HF-Onboard] Polling inventory for up to {_TIMEOUT_VERIFY_SECS:.0f}s while the backend completes processing...")
+
+    deadline = time.monotonic() + _TIMEOUT_VERIFY_SECS
+    interval = 2.0
+    first = True
+    while True:
+        pending = [r for r in resources if r["display_name"] not in found]
+        # Query inventory to verify if resources were actually created.
+        # Only the first poll is verbose; later polls print only new matches.
+        newly_found = _verify_onboarded_resources(jwt, pending, project_id, verbose=first)
+        first = False
+        found.update(newly_found)
+        if all(r["display_name"] in found for r in resources):
+            break
+        if newly_found:
+            print(f"[HF-Onboard] Verified {len(found)} model(s) so far, still waiting on the rest...")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(10.0, interval * 1.5)
+
+    if found:
+        print(f"\n[HF-Onboard] OK Successfully verified {len(set(found.values()))} model(s) were created despite timeout")
+    else:
+        print(f"[HF-Onboard] X Gateway timeout and resources not found in inventory")
+        print(f"[HF-Onboard]    This may indicate the backend failed to create the resources")
+    return found
+
+
+def _onboard_batch(jwt: str, resources: List[dict], project_id: str) -> Optional[List[str]]:
+    """
+    Submit one onboarding request for a batch of resource payloads.
+
+    Returns:
+        List of resource instance IDs for the onboarded models in this batch,
+        or None on a 504 (creation may still have succeeded; the caller
+        verifies all timed-out batches together via _recover_timed_out_resources).
+    """
     data = {
         "resources": resources,
         "cloud_provider_account_id": None,
@@ -146,11 +190,11 @@ def onboard_huggingface_models(jwt: str, models: List[Dict[str, Any]], project_i
     try:
         print(f"[HF-Onboard] Calling inventory API to onboard {len(resources)} model(s)...")
         response = api.make_api_request(
-            endpoint,
+            _ONBOARD_ENDPOINT,
             token=jwt,
             method="POST",
             data=data,
-            params=params,
+            params=_ONBOARD_PARAMS,
             timeout=60,
         )
         
@@ -182,39 +226,13 @@ def onboard_huggingface_models(jwt: str, models: List[Dict[str, Any]], project_i
             else:
                 print(f"[HF-Onboard] [!]  No resource_instance_id returned for: {res_identifier}")
 
-        if resource_ids:
-            print(f"\n[HF-Onboard] Successfully onboarded {len(resource_ids)} model(s)")
-
-            # Wait a moment for resources to be fully indexed
-            if config.HUGGINGFACE_ONBOARDING_WAIT_SECS > 0:
-                print(f"[HF-Onboard] Waiting {config.HUGGINGFACE_ONBOARDING_WAIT_SECS}s for indexing...")
-                time.sleep(config.HUGGINGFACE_ONBOARDING_WAIT_SECS)
-
         return resource_ids
         
     except requests.HTTPError as e:
         # Handle 504 Gateway Timeout - resources may have been created despite timeout
         if e.response.status_code == 504:
             print(f"[HF-Onboard] [TIMEOUT]  Gateway timeout (504) - resource creation may have succeeded")
-            print(f"[HF-Onboard] Waiting 10s for backend to complete processing...")
-            time.sleep(10)
-            
-            # Query inventory to verify if resources were actually created
-            resource_ids = _verify_onboarded_resources(jwt, resources, project_id)
-            
-            if resource_ids:
-                print(f"\n[HF-Onboard] OK Successfully verified {len(resource_ids)} model(s) were created despite timeout")
-                
-                # Wait for indexing as we would normally
-                if config.HUGGINGFACE_ONBOARDING_WAIT_SECS > 0:
-                    print(f"[HF-Onboard] Waiting {config.HUGGINGFACE_ONBOARDING_WAIT_SECS}s for indexing...")
-                    time.sleep(config.HUGGINGFACE_ONBOARDING_WAIT_SECS)
-                
-                return resource_ids
-            else:
-                print(f"[HF-Onboard] X Gateway timeout and resources not found in inventory")
-                print(f"[HF-Onboard]    This may indicate the backend failed to create the resources")
-                return []
+            return None
         else:
             # Other HTTP errors - print and return empty
             print(f"[HF-Onboard] X Error onboarding models: {e}")
@@ -225,6 +243,109 @@ def onboard_huggingface_models(jwt: str, models: List[Dict[str, Any]], project_i
         return []
 
 
+def onboard_huggingface_models(jwt: str, models: List[Dict[str, Any]], project_id: str) -> List[str]:
+    """
+    Onboard one or more HuggingFace models to inventory.
+
+    Models are submitted in batches of HUGGINGFACE_ONBOARDING_BATCH_SIZE
+    (0 = a single request). Multiple batches run in parallel, bounded by
+    HUGGINGFACE_ONBOARDING_CONCURRENCY, and the indexing wait is paid once at the end.
+
+    Args:
+        jwt: JWT authentication token
+        models: List of model configs, each containing:
+            - organization_id: HuggingFace organization/user (e.g., "IHasFarms")
+            - repo_name: HuggingFace repository name (e.g., "MaliciousModel")
+            - revision: Git revision (default: "main")
+            - display_name: Optional custom display name
+        project_id: Project ID to associate models with
+
+    Returns:
+        List of resource instance IDs for the onboarded models
+    """
+    if not models:
+        print("[HF-Onboard] No models to onboard")
+        return []
+
+    # Validate the whole list up front, before any network I/O
+    models = _validate_models(models)
+    if not models:
+        print("[HF-Onboard] No valid models to onboard")
+        return []
+
+    print(f"\n{'='*80}")
+    print(f"ONBOARDING {len(models)} HUGGINGFACE MODEL(S) TO INVENTORY")
+    print(f"{'='*80}")
+
+    # Build the resources payload
+    resources = []
+    for model in models:
+        org_id = model["organization_id"]
+        repo_name = model["repo_name"]
+        revision = model["revision"]
+        display_name = model["display_name"]
+
+        print(f"[HF-Onboard] Preparing: {display_name} (revision: {revision})")
+
+        resources.append({
+            "display_name": display_name,
+            "cloud_provider_account_id": None,
+            "resource_type": "ModelPackage",
+            "resource_data": {
+                "storage_source": "HUGGINGFACE",
+                "credentials": {
+                    "revision": revision,
+                    "organization_id": org_id,
+                    "repo_name": repo_name,
+                    "storage_source": "HUGGINGFACE"
+                }
+            },
+            "technology_types": ["ModelPackage"],
+            "project_ids": [project_id],
+            "reviewed": "approved"
+        })
+
+    batch_size = config.HUGGINGFACE_ONBOARDING_BATCH_SIZE
+    if batch_size <= 0:
+        batch_size = len(resources)
+    batches = [resources[i:i + batch_size] for i in range(0, len(resources), batch_size)]
+
+    # Results keyed by batch index so resource IDs can be assembled in config order
+    results_by_batch: Dict[int, Optional[List[str]]] = {}
+    if len(batches) == 1:
+        results_by_batch[0] = _onboard_batch(jwt, batches[0], project_id)
+    else:
+        max_workers = max(1, min(len(batches), config.HUGGINGFACE_ONBOARDING_CONCURRENCY))
+        print(f"[HF-Onboard] Submitting {len(batches)} batch(es) of up to {batch_size} model(s) ({max_workers} in parallel)")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="HF-Onboard") as ex:
+            futs = {ex.submit(_onboard_batch, jwt, batch, project_id): i for i, batch in enumerate(batches)}
+            for fut in as_completed(futs):
+                results_by_batch[futs[fut]] = fut.result()
+
+    # Batches that hit a 504 are verified together in one inventory lookup
+    timed_out = [res for i, batch in enumerate(batches) if results_by_batch.get(i) is None for res in batch]
+    recovered = _recover_timed_out_resources(jwt, timed_out, project_id) if timed_out else {}
+
+    # Assemble IDs batch by batch; recovered batches slot in at their own position
+    resource_ids: List[str] = []
+    for i, batch in enumerate(batches):
+        batch_ids = results_by_batch.get(i)
+        if batch_ids is None:
+            batch_ids = [recovered[r["display_name"]] for r in batch if r["display_name"] in recovered]
+        resource_ids.extend(batch_ids)
+    resource_ids = list(dict.fromkeys(resource_ids))
+    if resource_ids:
+        print(f"\n[HF-Onboard] Successfully onboarded {len(resource_ids)} model(s)")
+
+        # Wait a moment for resources to be fully indexed
+        if config.HUGGINGFACE_ONBOARDING_WAIT_SECS > 0:
+            print(f"[HF-Onboard] Waiting {config.HUGGINGFACE_ONBOARDING_WAIT_SECS}s for indexing...")
+            time.sleep(config.HUGGINGFACE_ONBOARDING_WAIT_SECS)
+
+    return resource_ids
+
+
 def parse_huggingface_models_from_config() -> List[Dict[str, Any]]:
     """
     Parse HuggingFace model specifications from config.
@@ -242,41 +363,33 @@ def parse_huggingface_models_from_config() -> List[Dict[str, Any]]:
 
     models = []
 
-    # Try to parse as JSON first (full format)
-    try:
-        import json
-        parsed = json.loads(models_str)
-        if isinstance(parsed, list):
-            return parsed
-        elif isinstance(parsed, dict):
-            return [parsed]
-    except (json.JSONDecodeError, ValueError):
-        pass
-
-    # Parse simple format: "org/repo,org/repo"
+    # JSON format (full details) - only attempted when it looks like JSON,
+    # so the common comma-separated case skips the decode attempt entirely
+    if models_str.lstrip().startswith(("[", "{")):
+        try:
+            parsed = json.loads(models_str)
+            if isinstance(parsed, list):
+                return _validate_models(parsed, log_tag="[HF-Parse]")
+            elif isinstance(parsed, dict):
+                return _validate_models([parsed], log_tag="[HF-Parse]")
+        except ValueError:
+            pass
+
+    # Parse simple format: "org/repo,org/repo" (optional @revision suffix)
     for item in models_str.split(","):
         item = item.strip()
         if not item:
             continue
 
-        if "/" in item:
-            parts = item.split("/", 1)
-            org_id = parts[0].strip()
-            repo_name = parts[1].strip()
-
-            # Handle optional @revision suffix
-            revision = "main"
-            if "@" in repo_name:
-                repo_name, revision = repo_name.split("@", 1)
-                repo_name = repo_name.strip()
-                revision = revision.strip()
-
+        m = _HF_ENTRY_RE.match(item)
+        if m:
+            org_id, repo_name, revision = m.groups()
             models.append({
                 "organization_id": org_id,
                 "repo_name": repo_name,
-                "revision": revision,
+                "revision": revision or "main",
             })
         else:
             print(f"[HF-Parse] [!]  Invalid model format: '{item}' (expected 'org/repo' or 'org/repo@revision')")
 
-    return models
\ No newline at end of file
+    return models
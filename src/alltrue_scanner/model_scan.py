@@ -206,6 +206,13 @@ def run_model_scan_for_resource(
     POLL_TIMEOUT_SECS = config.POLL_TIMEOUT_SECS
     start_ts = time.time()
 
+    def _gql_status() -> str:
+        try:
+            exec_info = api.query_model_scan_execution_status(jwt, model_scan_execution_id)
+        except Exception:
+            return ""
+        return (exec_info.get("status") or "").upper()
+
     def _gql_fetch():
         try:
             data = api.query_model_scan_execution_full(jwt, model_scan_execution_id)
@@ -228,9 +235,11 @@ def run_model_scan_for_resource(
                 "job_id": job_id,
             }
 
-        data, exec_info, status = _gql_fetch()
-        if status == "COMPLETED" and data is not None:
-            break
+        # Poll the status-only query; pull full per-policy results once COMPLETED
+        if _gql_status() == "COMPLETED":
+            data, exec_info, status = _gql_fetch()
+            if status == "COMPLETED" and data is not None:
+                break
         time.sleep(POLL_INTERVAL_SECS)
 
     per_policy = data.get("modelScanResultsPerPolicy") or []